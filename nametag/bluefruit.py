@@ -2,16 +2,28 @@
 
 import asyncio
 import collections
+import functools
+import itertools
 import logging
 import os
+import re
+import sys
 import time
 import urllib.parse
 from typing import Callable, Dict, Iterable, List, Optional, Set
 
 import attr
-import logfmt.parser  # type: ignore
 import serial  # type: ignore
 
+try:
+    # Optional; uvloop's C-level add_reader/call_soon dispatch is much
+    # cheaper than the default selector loop under the scan-message load.
+    import uvloop  # type: ignore
+
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,22 +41,44 @@ MAX_COMMAND_SIZE = 80
 MAX_CONNECTIONS = 5
 MAX_WRITES = 5
 MAX_SCAN_AGE = 60.0
+OP_TIMEOUT = 10.0
 
 
-@attr.define
+@attr.define(slots=True, weakref_slot=False)
 class Device:
     addr: str
     monotime: float = attr.ib(default=0.0, repr=lambda t: f"{t:.3f}")
     rssi: int = 0
+    handle: asyncio.Future = attr.ib(
+        factory=lambda: _new_future(-1), repr=False
+    )
     uuids: Set[int] = attr.ib(factory=set)
     mdata: bytes = b""
 
-    _handle_factory = lambda: _new_future(-1)
-    handle: asyncio.Future = attr.ib(factory=_handle_factory, repr=False)
-    writes: List[asyncio.Future] = attr.ib(factory=list, repr=False)
-    reads: Dict[int, asyncio.Future] = attr.ib(factory=dict, repr=False)
-    notify: Dict[int, asyncio.Future] = attr.ib(factory=dict, repr=False)
-
+    # Write window: a semaphore bounds outstanding writes, a counter
+    # tracks them, and one drain future wakes flush() when all clear.
+    writes_pending: int = attr.ib(default=0, repr=False)
+    writes_sem: asyncio.Semaphore = attr.ib(
+        factory=lambda: asyncio.Semaphore(MAX_WRITES), repr=False
+    )
+    writes_drained: asyncio.Future = attr.ib(
+        factory=lambda: _new_future(True), repr=False
+    )
+
+    log_prefix: str = attr.ib(init=False, repr=False)
+
+    @log_prefix.default
+    def _log_prefix_default(self):
+        return f"[{self.addr}]"
+
+    # Indexed by attribute handle (small ints); None = never used.
+    reads: List[Optional[asyncio.Future]] = attr.ib(factory=list, repr=False)
+    notify: List[Optional[asyncio.Future]] = attr.ib(factory=list, repr=False)
+
+    # Connection state is always derived from the handle future; it is
+    # completed from several places (conn/fail/disconn messages, poison
+    # on shutdown, operation timeouts), so a separately tracked state
+    # flag could not be kept in sync reliably.
     @property
     def fully_connected(self):
         h = self.handle
@@ -58,14 +92,29 @@ class Device:
 
 class Bluefruit:
     def __init__(self, *, port):
-        self._devs: Dict[str, Device] = {}
+        # Ordered by last scan message (see _on_time_message aging).
+        self._devs: "collections.OrderedDict[str, Device]" = (
+            collections.OrderedDict()
+        )
         self._handles: Dict[int, Device] = {}
         self._serial: _SerialPort = _SerialPort(port=port or DEFAULT_PORT)
+        self._out_pending = bytearray()
+        self._dispatch: Dict[str, Callable] = {
+            name[4:-8]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_on_") and name.endswith("_message")
+        }
+        # High-frequency or separately-logged types: no per-line debug.
+        self._quiet_keys = frozenset(("scan", "time", "ERR"))
+        self._now = time.monotonic()  # Refreshed once per read batch.
 
         self.busy_connecting: Set[str] = set()
         self.totals = self._serial.totals
 
     async def __aenter__(self):
+        if uvloop is None:
+            logger.debug("uvloop not found, using default event loop")
+        self._loop = asyncio.get_running_loop()
         await self._serial.__aenter__()
         self._reader: asyncio.Task = asyncio.create_task(self._reader_task())
         return self
@@ -105,6 +154,7 @@ class Bluefruit:
 
         self._reader.done() and self._reader.result()
         dev.handle = _update_future(dev.handle)
+        self._add_timeout(dev.handle, f"[{dev.addr}] Connect")
         self.busy_connecting.add(dev.addr)
         await self._send_command("conn", dev.addr)
         try:
@@ -125,43 +175,73 @@ class Bluefruit:
             # Does NOT block for completion ("await dev.handle").
 
     async def write(self, dev: Device, attr: int, data: bytes):
-        while len(dev.writes) >= MAX_WRITES:
+        if dev.writes_sem.locked():
             logger.debug(
-                f"[{dev.addr}] {len(dev.writes)} writes pending; await one..."
+                "%s %d writes pending; await one...",
+                dev.log_prefix,
+                dev.writes_pending,
             )
-            await dev.writes[0]
+        await dev.writes_sem.acquire()
         if not dev.fully_connected:
+            dev.writes_sem.release()
             raise BluefruitError("Write to non-connected device")
 
         self._reader.done() and self._reader.result()
-        dev.writes.append(_new_future())
+        dev.writes_pending += 1
+        if dev.writes_drained.done():
+            dev.writes_drained = _new_future()
         text = _to_text(data)
-        logger.debug(f"[{dev.addr}] Sending write; {len(dev.writes)} pending")
+        logger.debug(
+            "%s Sending write; %d pending", dev.log_prefix, dev.writes_pending
+        )
         await self._send_command("write", dev.handle.result(), attr, text)
 
     async def flush(self, dev: Device):
-        if dev.writes:
-            logger.debug(f"[{dev.addr}] Flushing {len(dev.writes)} writes...")
-            await dev.writes[-1]  # Wait for writes so far to clear.
-            logger.debug(f"[{dev.addr}] All writes done")
+        if dev.writes_pending:
+            logger.debug(
+                "%s Flushing %d writes...", dev.log_prefix, dev.writes_pending
+            )
+            self._add_timeout(dev.writes_drained, f"[{dev.addr}] Flush")
+            await dev.writes_drained
+            logger.debug("%s All writes done", dev.log_prefix)
 
     async def read(self, dev: Device, attr: int) -> bytes:
         if not dev.fully_connected:
             raise BluefruitError("Read from non-connected device")
 
         self._reader.done() and self._reader.result()
-        dev.reads[attr] = _update_future(dev.reads.get(attr))
+        dev.reads[attr] = _update_future(_attr_slot(dev.reads, attr))
         await self._send_command("read", dev.handle.result(), attr)
-        return await dev.reads[attr]
-
-    def prepare_notify(self, dev: Device, attr: int) -> asyncio.Future:
+        read = dev.reads[attr]
+        assert read is not None
+        self._add_timeout(read, f"[{dev.addr}] Read")
+        return await read
+
+    def prepare_notify(
+        self, dev: Device, attr: int, *, timeout: Optional[float] = None
+    ) -> asyncio.Future:
         if not dev.fully_connected:
             raise BluefruitError("Notify prepare for non-connected device")
 
         self._reader.done() and self._reader.result()
-        future = dev.notify[attr] = _update_future(dev.notify.get(attr))
+        future = dev.notify[attr] = _update_future(_attr_slot(dev.notify, attr))
+        if timeout is not None:
+            self._add_timeout(future, f"[{dev.addr}] Notify", timeout)
         return future
 
+    def _add_timeout(
+        self, future: asyncio.Future, what: str, timeout: float = OP_TIMEOUT
+    ):
+        # Cheaper than asyncio.wait_for: no wrapper task, just a timer
+        # that fails the future if nothing resolves it in time.
+        def on_timeout():
+            if not future.done():
+                future.set_exception(BluefruitError(f"{what} timeout"))
+                future.exception()  # Avoid warning if not received
+
+        handle = self._loop.call_later(timeout, on_timeout)
+        future.add_done_callback(lambda _: handle.cancel())
+
     async def send_dummy(self, data: bytes, *, echo: bool = False):
         await self._send_command("echo" if echo else "noop", _to_text(data))
 
@@ -169,32 +249,47 @@ class Bluefruit:
         logger.debug("Starting serial reader task...")
         first_line = True
         buffer = bytearray()
+        start = 0  # Offset of the first unconsumed line.
+        # Pre-bound locals; this loop runs for every serial chunk.
+        monotonic = time.monotonic
+        on_line = self._on_serial_line
+        serial_read = self._serial.read
         while True:
             try:
-                data = await asyncio.wait_for(self._serial.read(), timeout=1.5)
+                data = await asyncio.wait_for(serial_read(), timeout=1.5)
             except asyncio.TimeoutError as exc:
                 raise PortError("Adapter serial timeout") from exc
+            scan_from = len(buffer)  # Only new bytes need newline scans.
             buffer.extend(data)
-            lines = buffer.split(b"\n")
-            buffer = lines.pop()
-            for line in lines:
+            self._now = monotonic()  # One clock read per batch.
+            while (newline := buffer.find(b"\n", scan_from)) >= 0:
                 if not first_line:  # The first line may be partial.
-                    self._on_serial_line(line)
+                    # bytes, not a bytearray slice: message keys become
+                    # dict keys and must be hashable.
+                    line = bytes(memoryview(buffer)[start:newline])
+                    on_line(line)
                 first_line = False
+                start = scan_from = newline + 1
+            if start > 4096:  # Compact once the dead prefix grows.
+                del buffer[:start]
+                start = 0
 
     def _poison_device(self, dev: Device, exc: Exception):
         if dev.handle and not dev.handle.done():
             _update_future(dev.handle, exc=exc)
 
-        writes, dev.writes = dev.writes, []
-        for write in [w for w in writes if not w.done()]:
-            _update_future(write, exc=exc)
+        pending, dev.writes_pending = dev.writes_pending, 0
+        for _ in range(pending):
+            dev.writes_sem.release()
+        if pending:
+            dev.writes_drained = _update_future(dev.writes_drained, exc=exc)
 
-        for read in [r for r in dev.reads.values() if not r.done()]:
-            _update_future(read, exc=exc)
-
-        for notify in [n for n in dev.notify.values() if not n.done()]:
-            _update_future(notify, exc=exc)
+        reads, dev.reads = dev.reads, []
+        notify, dev.notify = dev.notify, []
+        for future in itertools.chain(reads, notify):
+            if future is not None and not future.done():
+                future.set_exception(exc)
+                future.exception()  # Avoid warning if not received
 
     def _poison_all(self, exc: Exception):
         for dev in self._devs.values():
@@ -206,17 +301,39 @@ class Bluefruit:
         if len(data) > MAX_COMMAND_SIZE:
             raise BluefruitError(f"Command too long ({len(data)}b): {line}")
 
-        logger.debug(f"=> {line}")
+        logger.debug("=> %s", line)
         self._reader.done() and self._reader.result()
-        self._serial.write(data)
+        if not self._out_pending:  # Flush once per event-loop tick.
+            self._loop.call_soon(self._flush_commands)
+        self._out_pending.extend(data)
+
+    def _flush_commands(self):
+        out, self._out_pending = self._out_pending, bytearray()
+        try:
+            if out:
+                self._serial.write(out)  # _SerialPort takes ownership.
+        except BluefruitError as exc:
+            # The reader task fails with the same error; callers see it.
+            logger.warning(f"Deferred command write failed: {exc}")
 
     def _on_serial_line(self, line: bytes):
+        # Raw-byte prefilter: most scan reports are from unrelated BLE
+        # devices; drop them before paying for a full parse. (Firmware
+        # prints UUIDs and %-escapes lowercase, so plain byte matches
+        # suffice; every consumer of devices() filters to nametags.)
+        if line.startswith(b"scan=") and (
+            b"fff0" not in line or not _SCAN_MDATA_RE.search(line)
+        ):
+            return
         message = _InputMessage(line)
         if message:
-            first_key = next(iter(message.keys()))
-            dispatch_method = getattr(self, f"_on_{first_key}_message", None)
-            if first_key != "scan":
-                logger.debug(f"{'<=' if dispatch_method else '|<'} {message}")
+            first_key = message.first_key
+            dispatch_method = self._dispatch.get(first_key)
+            if first_key not in self._quiet_keys:
+                # Lazy %s so _InputMessage.__repr__ only runs when debug
+                # logging is actually enabled.
+                arrow = "<=" if dispatch_method else "|<"
+                logger.debug("%s %s", arrow, message)
             if dispatch_method:
                 dispatch_method(message)
 
@@ -224,7 +341,7 @@ class Bluefruit:
         logger.error(f"Bluefruit error: {message}")
 
     def _on_conn_message(self, message):
-        dev = self._devs.get(message["conn"])
+        dev = self._devs.get(_to_str(message["conn"]))
         handle = int(message["handle"])
         if not dev:
             logger.warning(f'Unmatched "conn": {message}')
@@ -232,11 +349,12 @@ class Bluefruit:
 
         self._handles[handle] = dev
         dev.handle = _update_future(dev.handle, handle)
-        dev.monotime = time.monotonic()
+        dev.monotime = self._now
 
     def _on_conn_fail_message(self, message):
         addr = message["conn_fail"]
-        if isinstance(addr, str):
+        if addr is not True:
+            addr = _to_str(addr)
             if addr not in self._devs:
                 logger.warning(f'Unmatched "conn_fail": {message}')
                 return
@@ -255,7 +373,7 @@ class Bluefruit:
             logger.warning(f'Unmatched "disconn": {message}')
             return
 
-        dev.monotime = time.monotonic()
+        dev.monotime = self._now
         dev.handle = _update_future(dev.handle, -1)
         self._poison_device(dev, BluefruitError(f"Disconnected: {message}"))
 
@@ -270,30 +388,33 @@ class Bluefruit:
 
     def _on_notify_message(self, message):
         dev = self._handles.get(int(message["conn"]))
-        attr = int(message["attr"])
-        data = _to_binary(message["data"])
         if not dev:
             logger.warning(f'Unmatched "notify": {message}')
             return
 
-        dev.monotime = time.monotonic()
-        dev.notify[attr] = _update_future(dev.notify.get(attr), data)
+        dev.monotime = self._now
+        # Notifications are only consumed through prepare_notify; with no
+        # armed (pending) future there is no reader, so skip the decode
+        # and future allocation instead of storing a dead result.
+        future = _attr_slot(dev.notify, int(message["attr"]))
+        if future is not None and not future.done():
+            future.set_result(_to_binary(message["data"]))
 
     def _on_read_message(self, message):
         dev = self._handles.get(int(message["conn"]))
         attr = int(message["attr"])
         data = _to_binary(message["data"])
-        if not dev or attr not in dev.reads:
+        if not dev or _attr_slot(dev.reads, attr) is None:
             logger.warning(f'Unmatched "read": {message}')
             return
 
-        dev.monotime = time.monotonic()
+        dev.monotime = self._now
         dev.reads[attr] = _update_future(dev.reads[attr], data)
 
     def _on_read_fail_message(self, message):
         dev = self._handles.get(int(message["conn"]))
         attr = int(message["attr"])
-        if not dev or attr not in dev.reads:
+        if not dev or _attr_slot(dev.reads, attr) is None:
             logger.warning(f'Unmatched "read_fail": {message}')
             return
 
@@ -301,27 +422,38 @@ class Bluefruit:
         dev.reads[attr] = _update_future(dev.reads[attr], exc=exc)
 
     def _on_scan_message(self, message):
-        addr = message["scan"]
+        addr = _to_str(message["scan"])
         dev = self._devs.get(addr)
         if not dev:
             dev = self._devs[addr] = Device(addr=addr)
-            logger.debug(f"[{dev.addr}] NEW DEVICE")
+            logger.debug("%s NEW DEVICE", dev.log_prefix)
+        else:
+            self._devs.move_to_end(addr)
 
-        dev.monotime = time.monotonic()
+        dev.monotime = self._now
         dev.rssi = int(message.get("s", 0))
-        dev.uuids = {int(u, 16) for u in message.get("u", "").split(",") if u}
-        dev.mdata = _to_binary(str(message.get("m", "")))
+        dev.uuids = _parse_uuids(message.get("u", b""))
+        dev.mdata = _to_binary(message.get("m", b""))
 
     def _on_time_message(self, message):
-        mono = time.monotonic()
-        self._devs, old_scan = {}, self._devs
-        for addr, dev in old_scan.items():
-            h = dev.handle
+        # _devs is ordered by last scan, so expired devices cluster at
+        # the front; stop at the first fresh one instead of rescanning
+        # (and rebuilding) the whole dict every time tick.
+        mono = self._now
+        devs = self._devs
+        still_busy = []
+        while devs:
+            addr, dev = next(iter(devs.items()))
             age = mono - dev.monotime
-            if age < MAX_SCAN_AGE or not dev.fully_disconnected:
-                self._devs[addr] = dev
+            if age < MAX_SCAN_AGE:
+                break
+            del devs[addr]
+            if dev.fully_disconnected:
+                logger.debug("%s LOST (%.1fs)", dev.log_prefix, age)
             else:
-                logger.debug(f"[{dev.addr}] LOST ({age:.1f}s)")
+                still_busy.append((addr, dev))  # Keep despite age.
+        for addr, dev in still_busy:
+            devs[addr] = dev
 
     def _on_write_message(self, message):
         dev = self._handles.get(int(message["conn"]))
@@ -330,47 +462,119 @@ class Bluefruit:
             logger.warning(f'Unmatched "write": {message}')
             return
 
-        dev.monotime = time.monotonic()
-        if count > len(dev.writes):
+        dev.monotime = self._now
+        if count > dev.writes_pending:
             logger.warning(
                 f'[{dev.addr}] Unmatched "write" '
-                f"(count={count} > pending={len(dev.writes)}: {message}"
+                f"(count={count} > pending={dev.writes_pending}: {message}"
             )
+            count = dev.writes_pending
 
-        done, dev.writes = dev.writes[:count], dev.writes[count:]
+        dev.writes_pending -= count
+        for _ in range(count):
+            dev.writes_sem.release()
         logger.debug(
-            f"[{dev.addr}] {len(done)} writes done; {len(dev.writes)} pending"
+            "%s %d writes done; %d pending",
+            dev.log_prefix,
+            count,
+            dev.writes_pending,
         )
-        for write in [w for w in done if not w.done()]:
-            write.set_result(True)
+        if not dev.writes_pending and not dev.writes_drained.done():
+            dev.writes_drained.set_result(True)
 
     def _on_write_fail_message(self, message):
         dev = self._handles.get(int(message["conn"]))
-        if not dev or not dev.writes:
+        if not dev or not dev.writes_pending:
             logger.warning(f'Unmatched "write_fail": {message}')
             return
 
         exc = BluefruitError(f"Write failed: {message}")
-        failed, dev.writes = dev.writes, []
-        logger.debug(f"[{dev.addr}] {len(failed)} writes failed; 0 pending")
-        for write in [w for w in failed if not w.done()]:
-            write.set_exception(exc)
-            write.exception()  # Avoid warning if not received
+        failed, dev.writes_pending = dev.writes_pending, 0
+        for _ in range(failed):
+            dev.writes_sem.release()
+        logger.debug("%s %d writes failed; 0 pending", dev.log_prefix, failed)
+        dev.writes_drained = _update_future(dev.writes_drained, exc=exc)
+
+
+# Matches a manufacturer-data field whose bytes 6:8 are 0xffff (the
+# nametag signature checked by Nametag.id_if_nametag); each raw byte
+# prints as one safe character or a lowercase %xx escape (see
+# print_escaped in bluetalk.ino).
+_SCAN_MDATA_RE = re.compile(rb" m=(?:[^ %]|%[0-9a-f]{2}){6}%ff%ff")
+
+
+# Matches logfmt tokens: bare keys (=> True) and plain or quoted values.
+_LOGFMT_RE = re.compile(
+    rb'(?:^|(?<=\s))([A-Za-z_]\w*)(?:=(?:"([^"]*)"|(\S*)))?(?=\s|$)'
+)
+
+
+# Serial lines repeat the same few keys endlessly; reuse one interned
+# str per raw key so dict probes hit the identity fast path.
+_KEY_CACHE: Dict[bytes, str] = {}
+
+
+def _decode_key(raw: bytes) -> str:
+    key = _KEY_CACHE.get(raw)
+    if key is None:
+        if len(_KEY_CACHE) > 1000:
+            _KEY_CACHE.clear()
+        key = _KEY_CACHE[raw] = sys.intern(raw.decode("ascii"))
+    return key
+
+
+_IDENT_BYTES = (
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+)
 
 
 class _InputMessage(dict):
+    __slots__ = ("first_key",)  # Message type for dispatch.
+
     def __init__(self, data):
-        text = data.decode("L1").strip()
-        values = logfmt.parser.parse_line(text)
-        super().__init__((k, v) for k, v in values.items() if k.isidentifier())
+        first = None
+        if b'"' not in data:
+            # Fast path: plain tokens split/partition in C; the regex is
+            # only needed to handle quoted values.
+            for token in data.split():
+                raw, eq, value = token.partition(b"=")
+                if not raw or raw.lstrip(_IDENT_BYTES) or raw[:1].isdigit():
+                    continue
+                key = _decode_key(raw)
+                if first is None:
+                    first = key
+                self[key] = value or True
+        else:
+            for m in _LOGFMT_RE.finditer(data):
+                key = _decode_key(m.group(1))
+                if first is None:
+                    first = key
+                self[key] = _group_value(m)
+        self.first_key = first or ""
 
     def __repr__(self):
-        return "<" + " ".join(f"{k}={v}" for k, v in self.items()) + ">"
+        items = (
+            f"{k}={v.decode('L1') if isinstance(v, bytes) else v}"
+            for k, v in self.items()
+        )
+        return "<" + " ".join(items) + ">"
+
+
+def _group_value(m):
+    quoted, plain = m.group(2), m.group(3)
+    if quoted is not None:
+        return quoted
+    return plain or True
 
 
 class _SerialPort:
+    # The event loop owns the fd directly (add_reader/add_writer); at
+    # 115200 baud the kernel buffer gives far more headroom than loop
+    # latency needs, so no separate I/O thread is warranted.
     def __init__(self, *, port):
         self._port = port
+        self._read_buffer = bytearray(65536)
+        self._read_view = memoryview(self._read_buffer)
         self.totals: collections.Counter = collections.Counter()
 
     async def __aenter__(self):
@@ -381,13 +585,22 @@ class _SerialPort:
             try:
                 self._serial.open()
                 self._fileno = self._serial.fileno()
+                os.set_blocking(self._fileno, False)
+                try:
+                    # ASYNC_LOW_LATENCY: deliver USB-serial input as it
+                    # arrives instead of batching for up to ~10ms.
+                    self._serial.set_low_latency_mode(True)
+                except (OSError, ValueError, NotImplementedError) as exc:
+                    logger.debug(f"Low-latency mode not set: {exc}")
                 self._serial.read(self._serial.in_waiting)  # Discard buffered
             except (OSError, serial.serialutil.SerialException) as exc:
                 raise PortError("Adapter serial open failed") from exc
 
-            loop = asyncio.get_running_loop()
+            loop = self._loop = asyncio.get_running_loop()
             self._from_serial = loop.create_future()
-            self._to_serial = bytearray()
+            self._in_buffer = bytearray()
+            self._to_serial: collections.deque = collections.deque()
+            self._write_offset = 0  # Into the first queued chunk.
             loop.add_reader(self._fileno, self._on_readable, self._fileno)
             return self
         except Exception:
@@ -398,7 +611,7 @@ class _SerialPort:
         if self._serial and self._serial.is_open and self._fileno is not None:
             try:
                 logger.debug(f"Closing adapter serial ({self._port})")
-                loop = asyncio.get_running_loop()
+                loop = self._loop
                 loop.remove_reader(self._fileno)
                 loop.remove_writer(self._fileno)
                 self._serial.close()
@@ -406,49 +619,113 @@ class _SerialPort:
                 logger.warning(f"Serial close failed ({self._port}): {exc}")
 
     async def read(self) -> bytearray:
-        data = await self._from_serial
-        self._from_serial = _new_future()
+        await self._from_serial  # Signals that _in_buffer has data.
+        self._from_serial = self._loop.create_future()
+        data, self._in_buffer = self._in_buffer, bytearray()
         return data
 
     def write(self, data: bytes):
+        # Takes ownership of data; the caller must not reuse the buffer.
         if self._from_serial.done():
             self._from_serial.result()  # Raise exception if present
-        if not self._to_serial:
-            loop = asyncio.get_running_loop()
-            loop.add_writer(self._fileno, self._on_writable, self._fileno)
-        self._to_serial.extend(data)
+        if self._to_serial:  # A writer is registered and draining.
+            self._to_serial.append(data)
+            return
+
+        # Eager write: usually the kernel buffer takes everything, so no
+        # add_writer/remove_writer (epoll_ctl) round trip is needed.
+        try:
+            written = os.write(self._fileno, data)
+        except BlockingIOError:
+            written = 0
+        except OSError as os_error:
+            logger.warning(f"Serial write failed ({self._port}): {os_error}")
+            exc = PortError("Adapter serial write failed")
+            exc.__cause__ = os_error
+            self._from_serial = _update_future(self._from_serial, exc=exc)
+            return
+        self.totals["write"] += written
+        if written < len(data):
+            self._to_serial.append(data)
+            self._write_offset = written
+            self._loop.add_writer(self._fileno, self._on_writable, self._fileno)
 
     def _on_readable(self, fileno):
         try:
-            data = self._serial.read(self._serial.in_waiting)
-            self.totals["read"] += len(data)
+            # Drain everything available per wakeup (os.readv into the
+            # preallocated buffer, no FIONREAD ioctl), bounded so one
+            # firehose can't starve the loop. Coalescing reads grow one
+            # buffer until read() consumes it; the future just flags
+            # data available.
+            total = 0
+            while True:
+                try:
+                    count = os.readv(fileno, (self._read_view,))
+                except BlockingIOError:
+                    break
+                if count <= 0:
+                    break
+                self._in_buffer.extend(self._read_view[:count])
+                total += count
+                if count < len(self._read_buffer) or total > 262144:
+                    break
+            self.totals["read"] += total
             if not self._from_serial.done():
-                self._from_serial.set_result(bytearray(data))
+                if total:
+                    self._from_serial.set_result(True)
             elif self._from_serial.cancelled() or self._from_serial.exception():
-                asyncio.get_running_loop().remove_reader(fileno)
-            elif not self._from_serial.exception():
-                self._from_serial.result().extend(data)
+                self._loop.remove_reader(fileno)
         except (OSError, serial.serialutil.SerialException) as os_error:
             logger.warning(f"Serial read failed ({self._port}): {os_error}")
-            asyncio.get_running_loop().remove_reader(fileno)
+            self._loop.remove_reader(fileno)
             exc = PortError("Adapter serial read failed")
             exc.__cause__ = os_error
             self._from_serial = _update_future(self._from_serial, exc=exc)
 
     def _on_writable(self, fileno):
         try:
-            written = self._serial.write(self._to_serial)
-            self._to_serial = self._to_serial[written:]
+            # Submit all queued chunks in one scatter-gather syscall; an
+            # offset into the first chunk handles partial writes with no
+            # copying or concatenation.
+            queue = self._to_serial
+            try:
+                if len(queue) == 1:  # Common case: no gather needed.
+                    head = memoryview(queue[0])[self._write_offset :]
+                    written = os.write(fileno, head)
+                else:
+                    chunks = [memoryview(queue[0])[self._write_offset :]]
+                    chunks.extend(
+                        memoryview(c) for c in itertools.islice(queue, 1, None)
+                    )
+                    written = os.writev(fileno, chunks)
+            except BlockingIOError:
+                return
             self.totals["write"] += written
+            while written and queue:
+                remaining = len(queue[0]) - self._write_offset
+                if written < remaining:
+                    self._write_offset += written
+                    break
+                written -= remaining
+                queue.popleft()
+                self._write_offset = 0
         except (OSError, serial.serialutil.SerialException) as os_error:
             logger.warning(f"Serial write failed ({self._port}): {os_error}")
             exc = PortError("Adapter serial write failed")
             exc.__cause__ = os_error
             self._from_serial = _update_future(self._from_serial, exc=exc)
-            self._to_serial = bytearray()
+            self._to_serial.clear()
+            self._write_offset = 0
 
         if not self._to_serial:
-            asyncio.get_running_loop().remove_writer(fileno)
+            self._write_offset = 0
+            self._loop.remove_writer(fileno)
+
+
+def _attr_slot(slots: list, attr: int) -> Optional[asyncio.Future]:
+    if attr >= len(slots):
+        slots.extend([None] * (attr + 1 - len(slots)))
+    return slots[attr]
 
 
 def _update_future(future, result=None, *, exc=None):
@@ -468,9 +745,41 @@ def _new_future(result=None, *, exc=None):
     return future
 
 
-def _to_binary(text: str) -> bytes:
-    return urllib.parse.unquote(text, encoding="L1").encode("L1")
+_QUOTE_TABLE = [urllib.parse.quote(bytes([n])) for n in range(256)]
+_SAFE_BYTES = bytes(n for n in range(256) if len(_QUOTE_TABLE[n]) == 1)
+
+
+# Advertisements repeat the same few UUID lists; parse each one once.
+_UUIDS_CACHE: Dict[bytes, frozenset] = {}
+
+
+def _parse_uuids(data: bytes) -> frozenset:
+    uuids = _UUIDS_CACHE.get(data)
+    if uuids is None:
+        if len(_UUIDS_CACHE) > 1000:
+            _UUIDS_CACHE.clear()
+        parsed = frozenset(int(u, 16) for u in data.split(b",") if u)
+        uuids = _UUIDS_CACHE[data] = parsed
+    return uuids
+
+
+# Scan reports repeat identical manufacturer data for a given tag, so
+# memoizing makes repeat decodes a cache hit.
+@functools.lru_cache(maxsize=512)
+def _to_binary(data: bytes) -> bytes:
+    if b"%" not in data:
+        return data
+    return urllib.parse.unquote_to_bytes(data)
+
+
+# Message values stay raw bytes on the parse path; decode (memoized)
+# only where a str is needed, e.g. device addresses used as dict keys.
+@functools.lru_cache(maxsize=512)
+def _to_str(data: bytes) -> str:
+    return data.decode("L1")
 
 
 def _to_text(data: bytes) -> str:
-    return urllib.parse.quote(data)
+    if not data.translate(None, _SAFE_BYTES):
+        return data.decode("ascii")  # Nothing needed escaping.
+    return "".join([_QUOTE_TABLE[b] for b in data])
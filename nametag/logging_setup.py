@@ -1,35 +1,34 @@
 import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import sys
 
+_LEVEL_PREFIX = {
+    logging.DEBUG: "🕸  ",
+    logging.INFO: "  ",
+    logging.WARNING: "⚠️ ",
+    logging.ERROR: "🔥 ",
+    logging.CRITICAL: "💥 ",
+}
+
 
 class _LogFormatter(logging.Formatter):
     def format(self, record):
-        m = record.getMessage()
-        ml = m.lstrip()
-        out = ml.rstrip()
-        pre, post = m[: len(m) - len(ml)], ml[len(out) :]
+        out = record.getMessage().strip()
         if record.name != "root":
             out = f"{record.name}: {out}"
-        if record.levelno < logging.INFO:
-            out = f"🕸  {out}"
-        elif record.levelno >= logging.CRITICAL:
-            out = f"💥 {out}"
-        elif record.levelno >= logging.ERROR:
-            out = f"🔥 {out}"
-        elif record.levelno >= logging.WARNING:
-            out = f"⚠️ {out}"
-        else:
-            out = f"  {out}"
+        out = _LEVEL_PREFIX.get(record.levelno, "  ") + out
         if record.exc_info and not record.exc_text:
             record.exc_text = self.formatException(record.exc_info)
         if record.exc_text:
             out = f"{out.strip()}\n{record.exc_text}"
         if record.stack_info:
             out = f"{out.strip()}\n{record.stack_info}"
-        return pre + out.strip() + post
+        return out.strip()
 
 
 def _sys_exception_hook(exc_type, exc_value, exc_tb):
@@ -50,15 +49,27 @@ def _asyncio_exception_hook(loop, context):
         logging.critical(context["message"])
 
 
+def install_asyncio_hook():
+    # Must be called from a running loop: asyncio.run() creates a fresh
+    # loop, so installing at import time would target the wrong one.
+    asyncio.get_running_loop().set_exception_handler(_asyncio_exception_hook)
+
+
 def enable_debug():
     logging.getLogger().setLevel(logging.DEBUG)
     logging.getLogger("asyncio").setLevel(logging.INFO)
     logging.getLogger("bleak").setLevel(logging.INFO)
 
 
-# Initialize on import.
-_log_handler = logging.StreamHandler(stream=sys.stderr)
-_log_handler.setFormatter(_LogFormatter())
+# Initialize on import. Formatting and stderr writes happen on a
+# background listener thread so log calls stay cheap on the event loop.
+_log_stream_handler = logging.StreamHandler(stream=sys.stderr)
+_log_stream_handler.setFormatter(_LogFormatter())
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drain queued records before exit.
+_log_handler = logging.handlers.QueueHandler(_log_queue)
+_log_handler.setFormatter(logging.Formatter())  # Keep messages unformatted.
 logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 sys.excepthook = _sys_exception_hook
-asyncio.get_event_loop().set_exception_handler(_asyncio_exception_hook)
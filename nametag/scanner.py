@@ -36,6 +36,9 @@ async def scan_and_spawn(
     options: ScannerOptions = ScannerOptions(),
     **kwargs,
 ):
+    from nametag import logging_setup  # Deferred; import configures logging.
+
+    logging_setup.install_asyncio_hook()
     id_task: Dict[str, asyncio.Task] = {}
     id_attempt_mono: Dict[str, float] = {}
     id_success_mono: Dict[str, float] = {}
@@ -49,16 +52,16 @@ async def scan_and_spawn(
         tag = protocol.Nametag(adapter=adapter, dev=dev)
 
         async def tag_task():
-            logger.debug(f"[{tag.id}] Connecting...")
+            logger.debug("[%s] Connecting...", tag.id)
             adapter.busy_connecting.remove(tag.dev.addr)  # Handoff
             async with tag:
-                logger.debug(f"[{tag.id}] Connected, running tag task...")
+                logger.debug("[%s] Connected, running tag task...", tag.id)
                 await asyncio.wait_for(
                     runner(tag, *args, **kwargs), timeout=options.task_timeout
                 )
-                logger.debug(f"[{tag.id}] Tag task complete, flushing...")
+                logger.debug("[%s] Tag task complete, flushing...", tag.id)
                 await tag.flush()
-                logger.debug(f"[{tag.id}] Flush complete, disconnecting...")
+                logger.debug("[%s] Flush complete, disconnecting...", tag.id)
 
         def task_done(task):
             adapter.busy_connecting.discard(tag.dev.addr)
@@ -66,7 +69,7 @@ async def scan_and_spawn(
             try:
                 task.result()
                 id_success_mono[tag.id] = time.monotonic()
-                logger.debug(f"[{tag.id}] Tag task successful")
+                logger.debug("[%s] Tag task successful", tag.id)
             except StopScanningException as exc:
                 logger.debug(f"[{tag.id}] StopScanningException: {exc}")
                 nonlocal stop_received
@@ -74,7 +77,7 @@ async def scan_and_spawn(
             except bluefruit.BluefruitError as exc:
                 logger.warning(f"[{tag.id}] {exc}")
             except asyncio.CancelledError:
-                logger.debug(f"[{tag.id}] Tag task cancelled")
+                logger.debug("[%s] Tag task cancelled", tag.id)
             except Exception:
                 logger.error(f"[{tag.id}] Tag task failed", exc_info=True)
 
@@ -91,12 +94,18 @@ async def scan_and_spawn(
         return (success_mono, attempt_mono, id)
 
     def poll_adapter(adapter: bluefruit.Bluefruit) -> Dict[str, str]:
+        # Hoist option lookups out of the per-device loops; this runs
+        # every loop_delay tick for every visible device.
         monotime = time.monotonic()
+        success_delay = options.success_delay
+        attempt_delay = options.attempt_delay
+        stale_monotime = monotime - options.maximum_age
+        minimum_rssi = options.minimum_rssi
         id_dev = [
             (tag_id, dev)
             for dev in adapter.devices().values()
             for tag_id in [protocol.Nametag.id_if_nametag(dev)]
-            if tag_id and dev.monotime > monotime - 2 * options.maximum_age
+            if tag_id and dev.monotime > stale_monotime - options.maximum_age
         ]
 
         id_dev.sort(key=lambda id_dev: priority(id_dev[0]))
@@ -104,8 +113,8 @@ async def scan_and_spawn(
         for id, dev in id_dev:
             attempt = id_attempt_mono.get(id)
             success = id_success_mono.get(id)
-            success_retry = success + options.success_delay if success else 0
-            attempt_retry = attempt + options.attempt_delay if attempt else 0
+            success_retry = success + success_delay if success else 0
+            attempt_retry = attempt + attempt_delay if attempt else 0
             started = (attempt or 0) > (success or 0)
 
             status = f"{id}{dev.rssi:+02d}"
@@ -119,9 +128,9 @@ async def scan_and_spawn(
                 status = f"+{status}+"
             elif monotime < attempt_retry:
                 status = f"-{status}{'!' if started else '-'}"
-            elif dev.monotime < monotime - options.maximum_age and not started:
+            elif dev.monotime < stale_monotime and not started:
                 status = f"?{status}?"
-            elif (dev.rssi or -100) <= options.minimum_rssi and not started:
+            elif (dev.rssi or -100) <= minimum_rssi and not started:
                 status = f"/{status}/"
             elif not adapter.ready_to_connect(dev):
                 status = f"^{status}{'!' if started else '^'}"
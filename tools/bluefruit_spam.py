@@ -9,6 +9,7 @@ from nametag import bluefruit, logging_setup
 
 
 async def run(args):
+    logging_setup.install_asyncio_hook()
     async with bluefruit.Bluefruit(port=args.port) as adapter:
         start_mono = time.monotonic()
         next_status = 0.0
@@ -87,6 +87,7 @@ async def talk_to_nametag(tag: protocol.Nametag, args):
 
 
 async def run(args):
+    logging_setup.install_asyncio_hook()
     async with bluefruit.Bluefruit(port=args.port) as adapter:
         print("=== Finding nametag ===")
         next_print = 0.0